@@ -4,85 +4,245 @@ Chord progression: 0-6-11, 0-5-11, 0-5-13, 0-8-13, 0-5-13, 5-13-18, 4-12-18, 1-6
 """
 
 from tet19_music import TET19System, NoteEvent, LegatoSequence
-import time
-
-def create_chord_progression_piece():
-    """Create and play a piece with the specified chord progression and melody"""
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import numpy as np
+from numba import njit
+
+
+# Which sorted chord note each voice (bass, tenor, alto, soprano) plays, by chord size:
+# two notes double the bass and the top, three notes double the top
+VOICE_IDX = np.array([
+    [0, 0, 0, 0],
+    [0, 0, 0, 0],
+    [0, 0, 1, 1],
+    [0, 1, 2, 2],
+    [0, 1, 2, 3],
+], dtype=np.int8)
+
+
+@njit(cache=True)
+def _assign_voices(chord_flat, chord_offsets, durations, measure_duration):
+    """Sort each chord window of the flattened progression and split it into four voices"""
+    n = chord_offsets.size - 1
+    bass = np.empty(n, dtype=np.int32)
+    tenor = np.empty(n, dtype=np.int32)
+    alto = np.empty(n, dtype=np.int32)
+    soprano = np.empty(n, dtype=np.int32)
+    chord_durations = np.empty(n)
     
-    # Define the chord progression 
-    chord_progression = [
-        ([0, 11], 1),   
-        ([5, 11], 1),  
-        ([5, 13], 1),   
-        ([0, 11], 1),
-
-        ([0, 8], 1),   
-        ([5, 13], 1),   
-        ([8, 16], 1),
-        ([0, 6], 1),
-
-        ([0, 8], 1),   
-        ([5, 13], 1),   
-        ([8, 16], 1),
-        ([0, 6], 1),
-
-        ([0, 8], 1),
-        ([3, 11, 16], 0.25),
-        ([2, 10, 15], 0.25),
-        ([1, 9, 14], 0.25),
-        ([0, 8, 13], 0.25),
-        ([-3, 8], 1),
-        ([5, 13], 1),
-
-        ([2, 13], 1),
-        ([-1, 13], 1),
-        ([-1, 5], 1),
-        ([0, 11], 1),
-
-        ([0, 8], 1),
-        ([5, 13], 1),
-        ([13, 18], 1),
-        ([5, 13, 19], 1),
-
-        ([0, 8], 1),
-        ([5, 13], 1),
-        ([13, 18], 1),
-        ([5, 13, 19], 1),
-
-        ([0, 8], 1),
-        ([5, 13], 1),
-        ([13, 18], 1),
-        ([5, 13, 19], 1),
-
-        ([0, 8], 1),
-        ([5, 13], 1),
-        ([13, 18], 1),
-        ([5, 13, 19], 1),
-
-        ([5, 13, 18], 1),
-        ([4, 12, 18], 1),
-        ([1, 6, 12], 1),
-        ([0, 6, 11], 1),
+    for i in range(n):
+        lo = chord_offsets[i]
+        hi = chord_offsets[i + 1]
         
-        ([0, 6, 19, 6+19], 1),
-        ([6, 12, 6+19, 12+19], 1),
-        ([12, 18, 12+19, 18+19], 1),
-        ([12, 12+19, 18+19, 23+19], 1),
+        # Insertion sort of the chord window (chords only have a few notes)
+        for j in range(lo + 1, hi):
+            note = chord_flat[j]
+            k = j - 1
+            while k >= lo and chord_flat[k] > note:
+                chord_flat[k + 1] = chord_flat[k]
+                k -= 1
+            chord_flat[k + 1] = note
+        
+        # Branchless voice split: one table row per chord size
+        voices = VOICE_IDX[min(hi - lo, 4)]
+        bass[i] = chord_flat[lo + voices[0]] - 19      # Lower octave
+        tenor[i] = chord_flat[lo + voices[1]] - 19
+        alto[i] = chord_flat[lo + voices[2]] - 19
+        soprano[i] = chord_flat[lo + voices[3]] - 19
+        chord_durations[i] = durations[i] * measure_duration
+    
+    return bass, tenor, alto, soprano, chord_durations
 
-        ([13, 13+19, 19+19, 13+19], 1),
-        ([12, 12+19, 18+19, 12+19], 1),
-        ([11, 11+19, 19+19, 11+19], 2),
 
+@lru_cache(maxsize=4)
+def create_voice_lines(chord_progression, measure_duration, initial_delay):
+    """
+    Convert chord progression into four separate legato voice lines.
+    
+    Returns read-only bass, tenor, alto and soprano degree arrays plus the shared
+    chord duration array. The progression must be hashable (nested tuples);
+    repeated calls with the same arguments return the cached arrays.
+    """
+    # Flatten the variable-length chords once (CSR-style offsets)
+    chord_offsets = np.zeros(len(chord_progression) + 1, dtype=np.int32)
+    chord_offsets[1:] = np.cumsum([len(chord) for chord, _ in chord_progression])
+    chord_flat = np.array([note for chord, _ in chord_progression for note in chord], dtype=np.int32)
+    durations = np.array([d for _, d in chord_progression], dtype=np.float64)
+    
+    bass, tenor, alto, soprano, durations = _assign_voices(
+        chord_flat, chord_offsets, durations, float(measure_duration)
+    )
+    
+    for voice in (bass, tenor, alto, soprano, durations):
+        voice.flags.writeable = False      # Shared through the cache
+    return bass, tenor, alto, soprano, durations
+
+
+@lru_cache(maxsize=4)
+def create_legato_notes(melody, quarter_note_duration):
+    """Convert (note, duration-in-quarter-notes) pairs into parallel note and duration (seconds) arrays"""
+    notes = np.empty(len(melody), dtype=np.int32)
+    durations = np.empty(len(melody), dtype=np.float64)
+    for i, (note, d) in enumerate(melody):
+        notes[i], durations[i] = note, d * quarter_note_duration
+    
+    notes.flags.writeable = False
+    durations.flags.writeable = False
+    return notes, durations
+
+
+# The chord progression as ((degrees...), duration-in-measures) pairs
+CHORD_PROGRESSION = (
+    ((0, 11), 1),   
+    ((5, 11), 1),  
+    ((5, 13), 1),   
+    ((0, 11), 1),
+
+    ((0, 8), 1),   
+    ((5, 13), 1),   
+    ((8, 16), 1),
+    ((0, 6), 1),
+
+    ((0, 8), 1),   
+    ((5, 13), 1),   
+    ((8, 16), 1),
+    ((0, 6), 1),
+
+    ((0, 8), 1),
+    ((3, 11, 16), 0.25),
+    ((2, 10, 15), 0.25),
+    ((1, 9, 14), 0.25),
+    ((0, 8, 13), 0.25),
+    ((-3, 8), 1),
+    ((5, 13), 1),
+
+    ((2, 13), 1),
+    ((-1, 13), 1),
+    ((-1, 5), 1),
+    ((0, 11), 1),
+
+    ((0, 8), 1),
+    ((5, 13), 1),
+    ((13, 18), 1),
+    ((5, 13, 19), 1),
+
+    ((0, 8), 1),
+    ((5, 13), 1),
+    ((13, 18), 1),
+    ((5, 13, 19), 1),
+
+    ((0, 8), 1),
+    ((5, 13), 1),
+    ((13, 18), 1),
+    ((5, 13, 19), 1),
+
+    ((0, 8), 1),
+    ((5, 13), 1),
+    ((13, 18), 1),
+    ((5, 13, 19), 1),
+
+    ((5, 13, 18), 1),
+    ((4, 12, 18), 1),
+    ((1, 6, 12), 1),
+    ((0, 6, 11), 1),
+    
+    ((0, 6, 19, 6+19), 1),
+    ((6, 12, 6+19, 12+19), 1),
+    ((12, 18, 12+19, 18+19), 1),
+    ((12, 12+19, 18+19, 23+19), 1),
 
-        # ([5, 13, 18], 1),  
-        # ([4, 12, 18], 1),  
-        # ([1, 6, 12], 1),   
+    ((13, 13+19, 19+19, 13+19), 1),
+    ((12, 12+19, 18+19, 12+19), 1),
+    ((11, 11+19, 19+19, 11+19), 2),
 
-        # ([0, 8, 13], 1),
-        # ([0, 5, 13], 1),
-        # ([5, 13, 18], 1),
-        # ([4, 12, 18], 1),
-    ]
+
+    # ((5, 13, 18), 1),  
+    # ((4, 12, 18), 1),  
+    # ((1, 6, 12), 1),   
+
+    # ((0, 8, 13), 1),
+    # ((0, 5, 13), 1),
+    # ((5, 13, 18), 1),
+    # ((4, 12, 18), 1),
+)
+
+# Melody in quarter notes, as a simple list
+# melody = [0,3,6,11,16,11,5,0,13,19,16,8,13,18,3,0]
+
+# Melody as (note, duration-in-quarter-notes) pairs
+MELODY = (
+    (11, 1), (8, 1), (6, 1), (3, 0.25), (5, 0.25), (3, 0.25), (0, 0.25),
+    (5, 2), (11, 1), (16, 1),
+
+    (19, 3/4), (19+3, 1/8), (19, 1/8), 
+    (16, 3/4), (19, 1/8), (16, 1/8),
+    (11, 3/4), (16, 1/8), (11, 1/8), 
+    (8, 1),
+
+    (11, 4),
+
+    (13, 2), (8, 1/2), (11, 1/2), (13, 1/2), (16, 1/2), 
+
+    (19, 1), (3+19, 1), 
+    (5+19, 3/4), (8+19, 1/8), (5+19, 1/8),
+    (3+19, 1/2), (19, 1/2), 
+
+    (16, 1), (19, 1),
+    (2+19, 3/4), (5+19, 1/8), (2+19, 1/8),
+    (19, 1/4), (21, 1/8), (19, 1/8), (16, 1/2), 
+
+    (11, 2), (19, 2),
+
+    (13, 2), (8, 1/2), (11, 1/2), (13, 1/2), (16, 1/2), 
+
+    (19, 1), (2+19, 1), 
+    (5+19, 3/4), (6+19, 1/8), (5+19, 1/8),
+    (2+19, 1/2), (19, 1/2), 
+
+    (16, 1), (19, 1),
+    (2+19, 3/4), (5+19, 1/8), (2+19, 1/8),
+    (19, 1/4), (20, 1/8), (19, 1/8), (18, 1/2), 
+
+    (19, 4),
+
+    (8, 1), (0, 1), (8, 1/2), (5, 1/2), (3, 1/6), (5, 1/6), (3, 1/6), (0, 1/2),
+    (3, 4),
+    (5, 1), (-3, 1), (5, 1/2), (2, 1/2), (0, 1/6), (1, 1/6), (0, 1/6), (-1, 1/2),
+    (0, 1/4), (2, 1/4), (0, 1/6), (1, 1/6), (2, 1/6), 
+    (5, 1/4), (6, 1/8), (5, 1/8), (4, 1/6), (5, 1/6), (8, 1/6),
+    (5, 1/6), (2, 1/6), (5, 1/6), (5, 3/2),
+
+    (2, 1), (13-19, 1), (2, 1/2), (0, 1/2), (-1, 1/6), (0, 1/6), (-1, 1/6), (13-19, 1/2),
+    (-1, 4),
+    (10-19, 1), (13-19, 1), (10-19, 1/2), (13-19, 1/2), (18-19, 1/2), (2, 1/2),
+    (0, 4),
+
+    (5, 1/8), (0, 7/8), (5, 1), (8, 1), (13, 1),
+    (8, 1/8), (5, 7/8), (8, 1), (13, 1), (19, 1/8), (18, 3/4), (19, 1/8),
+    (13, 1/8), (8, 7/8), (13, 1), (18, 1), (5+19, 1),
+    (19, 3/2), (18, 1/4), (19, 1/4), (18, 1/12), (19, 1/12), (18, 1/12), (13, 1/4), (8, 1/4), (5, 1/4), (8, 1/4), (5, 1/4), (0, 1/4), (-1, 1/8), (0, 1/8),
+
+    (5, 1/8), (0, 7/8), (5, 1), (8, 1), (13, 1),
+    (8, 1/8), (5, 7/8), (8, 1), (13, 1), (19, 1/8), (18, 3/4), (19, 1/8),
+    (13, 1/8), (8, 7/8), (13, 1), (18, 1/3), (19, 1/3), (20, 1/3), (21, 1/3), (22, 1/3), (23, 1/3),
+    (5+19, 4),
+
+    (8+19, 2/3), (13+19, 1/6), (8+19, 1/6), (5+19, 1/3), (8+19, 1/3), (13+19, 1/3), 
+    (18+19, 1/2), (19+19, 1/12), (18+19, 1/12), (13+19, 1/6), (8+19, 1/6), (5+19, 1/4), (8+19, 1/4), (13+19, 1/4), (18+19, 1/4),
+    (13+19, 1/3), (18+19, 1/3), (5+38, 1/3), (8+38, 1/3), (5+38, 1/3), (18+19, 1/3), (19+19, 1/3), (18+19, 1/3), (17+19, 1/3), (16+19, 1/3), (15+19, 1/3), (14+19, 1/3),
+    (13+19, 1/3), (12+19, 1/3), (11+19, 1/3), (8+19, 1/3), (7+19, 1/3), (6+19, 1/3), (5+19, 1/3), (2+19, 1/3), (18, 1/3), (13, 1/3), (8, 1/3), (5, 1/3),
+
+    (8, 4),
+
+    # (13, 3/2), (11, 1/6), (13, 1/6), (11, 1/6), (8, 1), (13, 1),
+    # (19, 3/4), (2+19, 1/8), (5+19, 1/8), (6+19, 1/3), (5+19, 1/3), (2+19, 1/3), (19, 1), (13, 1)
+
+)
+
+
+def create_chord_progression_piece():
+    """Create and play a piece with the specified chord progression and melody"""
     
     # Timing: each chord lasts 3 seconds
     measure_duration = 2.5
@@ -91,193 +251,74 @@ def create_chord_progression_piece():
     print("19 TET Chord Progression Piece")
     print("=" * 35)
     print("Chord progression:")
-    for i, chord in enumerate(chord_progression, 1):
+    for i, chord in enumerate(CHORD_PROGRESSION, 1):
         print(f"  {i}. {chord}")
     print()
     
     tet = TET19System()
     
     try:
-        # Convert chord progression into four legato voice lines
-        def create_voice_lines(chord_progression, measure_duration, initial_delay):
-            """Convert chord progression into four separate legato voice lines"""
-            bass_line = []      # Lowest voice
-            tenor_line = []     # Second lowest
-            alto_line = []      # Second highest  
-            soprano_line = []   # Highest voice
-            
-            current_time = 0.0
-            
-            for (chord, d) in chord_progression:
-                chord_duration = d * measure_duration
-                
-                # Sort chord notes and assign to voices
-                sorted_chord = sorted(chord)
-                
-                if len(sorted_chord) >= 4:
-                    # Four or more notes: assign to all four voices
-                    bass_note = sorted_chord[0] - 19      # Lower octave
-                    tenor_note = sorted_chord[1] - 19     # Lower octave
-                    alto_note = sorted_chord[2] - 19      # Lower octave
-                    soprano_note = sorted_chord[3] - 19   # Lower octave
-                elif len(sorted_chord) == 3:
-                    # Three notes: bass gets bottom, others distributed
-                    bass_note = sorted_chord[0] - 19
-                    tenor_note = sorted_chord[1] - 19
-                    alto_note = sorted_chord[2] - 19
-                    soprano_note = sorted_chord[2] - 19   # Double the top note
-                elif len(sorted_chord) == 2:
-                    # Two notes: bass gets bottom, others get top
-                    bass_note = sorted_chord[0] - 19
-                    tenor_note = sorted_chord[0] - 19     # Double the bass
-                    alto_note = sorted_chord[1] - 19
-                    soprano_note = sorted_chord[1] - 19   # Double the top
-                else:
-                    # One note: all voices play same note in different octaves
-                    bass_note = sorted_chord[0] - 19
-                    tenor_note = sorted_chord[0] - 19
-                    alto_note = sorted_chord[0] - 19
-                    soprano_note = sorted_chord[0] - 19
-                
-                # Add to voice lines
-                bass_line.append((bass_note, chord_duration))
-                tenor_line.append((tenor_note, chord_duration))
-                alto_line.append((alto_note, chord_duration))
-                soprano_line.append((soprano_note, chord_duration))
-                
-                current_time += chord_duration
-            
-            return bass_line, tenor_line, alto_line, soprano_line
-        
         # Create the four voice lines
-        bass_line, tenor_line, alto_line, soprano_line = create_voice_lines(chord_progression, measure_duration, initial_delay)
+        bass_line, tenor_line, alto_line, soprano_line, chord_durations = create_voice_lines(CHORD_PROGRESSION, measure_duration, initial_delay)
         
         # Create legato sequences for each voice
         bass_sequence = LegatoSequence(
-            notes_and_durations=bass_line,
+            notes=bass_line,
+            durations=chord_durations,
             start_time=initial_delay,
             volume=0.4, #1.2,
             glide_time=0.005  # Quick transitions for bass
         )
         
         tenor_sequence = LegatoSequence(
-            notes_and_durations=tenor_line,
+            notes=tenor_line,
+            durations=chord_durations,
             start_time=initial_delay,
             volume=0.6, #1,
             glide_time=0.007  # Medium-quick transitions for tenor
         )
         
         alto_sequence = LegatoSequence(
-            notes_and_durations=alto_line,
+            notes=alto_line,
+            durations=chord_durations,
             start_time=initial_delay,
             volume=0.5,
             glide_time=0.010  # Medium transitions for alto
         )
         
         soprano_sequence = LegatoSequence(
-            notes_and_durations=soprano_line,
+            notes=soprano_line,
+            durations=chord_durations,
             start_time=initial_delay,
             volume=0.3,
             glide_time=0.015  # Slowest transitions for soprano (most expressive)
         )
-        
-        # Melody in quarter notes, as a simple list
-        # melody = [0,3,6,11,16,11,5,0,13,19,16,8,13,18,3,0]
-        
-        # Melody as a list of (note, duration-in-quarter-notes) pairs
-        melody = \
-        [
-        (11, 1), (8, 1), (6, 1), (3, 0.25), (5, 0.25), (3, 0.25), (0, 0.25),
-        (5, 2), (11, 1), (16, 1),
-        
-        (19, 3/4), (19+3, 1/8), (19, 1/8), 
-        (16, 3/4), (19, 1/8), (16, 1/8),
-        (11, 3/4), (16, 1/8), (11, 1/8), 
-        (8, 1),
-        
-        (11, 4),
-
-        (13, 2), (8, 1/2), (11, 1/2), (13, 1/2), (16, 1/2), 
-        
-        (19, 1), (3+19, 1), 
-        (5+19, 3/4), (8+19, 1/8), (5+19, 1/8),
-        (3+19, 1/2), (19, 1/2), 
-        
-        (16, 1), (19, 1),
-        (2+19, 3/4), (5+19, 1/8), (2+19, 1/8),
-        (19, 1/4), (21, 1/8), (19, 1/8), (16, 1/2), 
-
-        (11, 2), (19, 2),
-
-        (13, 2), (8, 1/2), (11, 1/2), (13, 1/2), (16, 1/2), 
-        
-        (19, 1), (2+19, 1), 
-        (5+19, 3/4), (6+19, 1/8), (5+19, 1/8),
-        (2+19, 1/2), (19, 1/2), 
-        
-        (16, 1), (19, 1),
-        (2+19, 3/4), (5+19, 1/8), (2+19, 1/8),
-        (19, 1/4), (20, 1/8), (19, 1/8), (18, 1/2), 
-
-        (19, 4),
-
-        (8, 1), (0, 1), (8, 1/2), (5, 1/2), (3, 1/6), (5, 1/6), (3, 1/6), (0, 1/2),
-        (3, 4),
-        (5, 1), (-3, 1), (5, 1/2), (2, 1/2), (0, 1/6), (1, 1/6), (0, 1/6), (-1, 1/2),
-        (0, 1/4), (2, 1/4), (0, 1/6), (1, 1/6), (2, 1/6), 
-        (5, 1/4), (6, 1/8), (5, 1/8), (4, 1/6), (5, 1/6), (8, 1/6),
-        (5, 1/6), (2, 1/6), (5, 1/6), (5, 3/2),
-
-        (2, 1), (13-19, 1), (2, 1/2), (0, 1/2), (-1, 1/6), (0, 1/6), (-1, 1/6), (13-19, 1/2),
-        (-1, 4),
-        (10-19, 1), (13-19, 1), (10-19, 1/2), (13-19, 1/2), (18-19, 1/2), (2, 1/2),
-        (0, 4),
-
-        (5, 1/8), (0, 7/8), (5, 1), (8, 1), (13, 1),
-        (8, 1/8), (5, 7/8), (8, 1), (13, 1), (19, 1/8), (18, 3/4), (19, 1/8),
-        (13, 1/8), (8, 7/8), (13, 1), (18, 1), (5+19, 1),
-        (19, 3/2), (18, 1/4), (19, 1/4), (18, 1/12), (19, 1/12), (18, 1/12), (13, 1/4), (8, 1/4), (5, 1/4), (8, 1/4), (5, 1/4), (0, 1/4), (-1, 1/8), (0, 1/8),
-
-        (5, 1/8), (0, 7/8), (5, 1), (8, 1), (13, 1),
-        (8, 1/8), (5, 7/8), (8, 1), (13, 1), (19, 1/8), (18, 3/4), (19, 1/8),
-        (13, 1/8), (8, 7/8), (13, 1), (18, 1/3), (19, 1/3), (20, 1/3), (21, 1/3), (22, 1/3), (23, 1/3),
-        (5+19, 4),
-
-        (8+19, 2/3), (13+19, 1/6), (8+19, 1/6), (5+19, 1/3), (8+19, 1/3), (13+19, 1/3), 
-        (18+19, 1/2), (19+19, 1/12), (18+19, 1/12), (13+19, 1/6), (8+19, 1/6), (5+19, 1/4), (8+19, 1/4), (13+19, 1/4), (18+19, 1/4),
-        (13+19, 1/3), (18+19, 1/3), (5+38, 1/3), (8+38, 1/3), (5+38, 1/3), (18+19, 1/3), (19+19, 1/3), (18+19, 1/3), (17+19, 1/3), (16+19, 1/3), (15+19, 1/3), (14+19, 1/3),
-        (13+19, 1/3), (12+19, 1/3), (11+19, 1/3), (8+19, 1/3), (7+19, 1/3), (6+19, 1/3), (5+19, 1/3), (2+19, 1/3), (18, 1/3), (13, 1/3), (8, 1/3), (5, 1/3),
-
-        (8, 4),
-
-        # (13, 3/2), (11, 1/6), (13, 1/6), (11, 1/6), (8, 1), (13, 1),
-        # (19, 3/4), (2+19, 1/8), (5+19, 1/8), (6+19, 1/3), (5+19, 1/3), (2+19, 1/3), (19, 1), (13, 1)
-
-        ]
 
         # Create melody using LegatoSequence for true phase continuity
         quarter_note_duration = measure_duration / 4
         
-        # Convert melody to format needed for LegatoSequence
-        legato_notes = []
-        for note, d in melody:
-            duration = d * quarter_note_duration
-            legato_notes.append((note, duration))
+        # Convert melody to format needed for LegatoSequence (cached across plays)
+        melody_notes, melody_durations = create_legato_notes(MELODY, quarter_note_duration)
         
         # Create legato sequence with smooth pitch transitions
         melody_sequence = LegatoSequence(
-            notes_and_durations=legato_notes,
+            notes=melody_notes,
+            durations=melody_durations,
             start_time=initial_delay,
             volume=0.45,#0.35,
             glide_time=0.01  # 10ms smooth pitch transitions
         )
         
         print("Pre-computing all legato sequences for optimal performance...")
-        tet.precompute_legato_sequence(bass_sequence)
-        tet.precompute_legato_sequence(tenor_sequence)
-        tet.precompute_legato_sequence(alto_sequence)
-        tet.precompute_legato_sequence(soprano_sequence)
-        tet.precompute_legato_sequence(melody_sequence)
+        # The voices are independent and the compiled synthesis kernels release the GIL, so render them concurrently
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            list(executor.map(tet.precompute_legato_sequence, [
+                bass_sequence,
+                tenor_sequence,
+                alto_sequence,
+                soprano_sequence,
+                melody_sequence,
+            ]))
         
         print("Playing the piece...")
         print("- Five-voice legato polyphony:")
@@ -289,14 +330,15 @@ def create_chord_progression_piece():
         print(f"- Each chord section lasts {measure_duration} seconds")
         print()
         
-        # Play all five legato voices together
-        tet.play_polyphonic([
+        # Play all five legato voices together, pre-mixed into a single buffer
+        mix = tet.mix_legato_sequences([
         bass_sequence, 
         tenor_sequence, 
         alto_sequence, 
         soprano_sequence, 
         melody_sequence
-        ], blocking=True)
+        ])
+        tet.play_buffer(mix, blocking=True)
         
         print("✨ Piece complete!")
         
@@ -314,10 +356,16 @@ def play_chords_only():
     tet = TET19System()
     
     try:
-        for i, chord in enumerate(chord_progression, 1):
-            print(f"Chord {i}: {chord}")
-            tet.play_chord(chord, 2.0, velocity=0.7, blocking=True)
-            time.sleep(0.5)
+        # Schedule every chord up front (2 s each, 0.5 s apart) so playback runs as one stream
+        chord_duration = 2.0
+        chord_spacing = 2.5
+        voices = [[] for _ in range(max(len(chord) for chord in chord_progression))]
+        for i, chord in enumerate(chord_progression):
+            print(f"Chord {i + 1}: {chord}")
+            for voice, degree in zip(voices, chord):
+                voice.append(NoteEvent(degree, chord_duration, i * chord_spacing, velocity=0.7))
+        
+        tet.play_polyphonic(voices, blocking=True)
     finally:
         tet.close()
 
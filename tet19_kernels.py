@@ -0,0 +1,123 @@
+"""
+Numba kernels for the 19 TET synthesis path.
+Every kernel is compiled eagerly for the exact argument types TET19System passes and
+cached on disk, so only the very first run pays for compilation; later runs just load
+the cached machine code on import.
+"""
+
+import math
+import numpy as np
+from numba import njit, types
+
+
+_float32_array = types.Array(types.float32, 1, 'C')
+_float64_array = types.Array(types.float64, 1, 'C')
+_readonly_float64_array = types.Array(types.float64, 1, 'C', readonly=True)
+_int64_array = types.Array(types.int64, 1, 'A')
+
+# synth_tone(freq, sample_rate, n, amplitudes, out)
+SYNTH_TONE_SIGNATURE = types.void(types.float64, types.int64, types.int64, _float64_array, _float32_array)
+
+# legato_harmonics(phases, amplitudes, out)
+LEGATO_HARMONICS_SIGNATURE = types.void(_float32_array, _float64_array, _float32_array)
+
+# freq_segments(target_freqs, durations, sample_rate, glide_samples, total_samples);
+# durations may be a read-only array shared through a cache
+_segments = types.Tuple((_int64_array, _int64_array, types.Array(types.float64, 1, 'A'), types.Array(types.float64, 1, 'A')))
+FREQ_SEGMENTS_SIGNATURES = [
+    _segments(_float64_array, durations, types.int64, types.int64, types.int64)
+    for durations in (_float64_array, _readonly_float64_array)
+]
+
+
+@njit(SYNTH_TONE_SIGNATURE, cache=True, fastmath=True, nogil=True)
+def synth_tone(freq, sample_rate, n, amplitudes, out):
+    """Write the sum of harmonics 1..len(amplitudes) of freq, weighted by amplitudes, into out in one pass"""
+    # Phase advance per sample, so each sample's base argument is a single multiply
+    phase_step = 2.0 * math.pi * freq / sample_rate
+    for i in range(n):
+        phi = phase_step * i
+        sin_curr = math.sin(phi)
+        two_cos = 2.0 * math.cos(phi)
+        sin_prev = 0.0
+        s = amplitudes[0] * sin_curr
+        # sin((h+1)φ) = 2cos(φ)sin(hφ) - sin((h-1)φ): one sin/cos pair per sample
+        for h in range(1, amplitudes.size):
+            sin_next = two_cos * sin_curr - sin_prev
+            s += amplitudes[h] * sin_next
+            sin_prev = sin_curr
+            sin_curr = sin_next
+        out[i] = s
+
+
+@njit(LEGATO_HARMONICS_SIGNATURE, cache=True, fastmath=True, nogil=True)
+def legato_harmonics(phases, amplitudes, out):
+    """
+    Write the sum of harmonics 1..len(amplitudes) at each phase, weighted by amplitudes, into out in one pass.
+    
+    Runs serially without the GIL: legato voices are rendered concurrently from a thread pool,
+    and numba's default threading layer does not support parallel kernels launched from several threads.
+    """
+    for i in range(phases.size):
+        sin_curr = math.sin(phases[i])
+        two_cos = 2.0 * math.cos(phases[i])
+        sin_prev = 0.0
+        s = amplitudes[0] * sin_curr
+        # sin((h+1)φ) = 2cos(φ)sin(hφ) - sin((h-1)φ): one sin/cos pair per sample
+        for h in range(1, amplitudes.size):
+            sin_next = two_cos * sin_curr - sin_prev
+            s += amplitudes[h] * sin_next
+            sin_prev = sin_curr
+            sin_curr = sin_next
+        out[i] = s
+
+
+@njit(FREQ_SEGMENTS_SIGNATURES, cache=True, nogil=True)
+def freq_segments(target_freqs, durations, sample_rate, glide_samples, total_samples):
+    """
+    Describe a legato frequency envelope as linear segments: a glide from the previous
+    pitch into every note but the first, then the note's constant pitch.
+    
+    Returns the start and end sample, start frequency and per-sample slope of each segment.
+    """
+    n = target_freqs.size
+    starts = np.empty(2 * n, dtype=np.int64)
+    ends = np.empty(2 * n, dtype=np.int64)
+    start_freqs = np.empty(2 * n)
+    slopes = np.empty(2 * n)
+    count = 0
+    last_freq = 0.0  # Frequency of the latest sample covered so far
+    current_time = 0.0
+    
+    for i in range(n):
+        target_freq = target_freqs[i]
+        
+        # Calculate sample indices for this note
+        start_sample = int(current_time * sample_rate)
+        end_sample = min(int((current_time + durations[i]) * sample_rate), total_samples)
+        
+        glide = 0
+        if i > 0:
+            glide = min(glide_samples, end_sample - start_sample)
+        if glide > 0:
+            # Same ramp as np.linspace(prev_freq, target_freq, glide)
+            prev_freq = last_freq if start_sample > 0 else target_freq
+            starts[count] = start_sample
+            ends[count] = start_sample + glide
+            start_freqs[count] = prev_freq
+            slopes[count] = (target_freq - prev_freq) / (glide - 1) if glide > 1 else 0.0
+            count += 1
+            last_freq = target_freq if glide > 1 else prev_freq
+        
+        # Constant frequency for remainder
+        if end_sample > start_sample + glide:
+            starts[count] = start_sample + glide
+            ends[count] = end_sample
+            start_freqs[count] = target_freq
+            slopes[count] = 0.0
+            count += 1
+            last_freq = target_freq
+        
+        current_time += durations[i]
+    
+    return starts[:count], ends[:count], start_freqs[:count], slopes[:count]
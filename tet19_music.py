@@ -8,9 +8,26 @@ import numpy as np
 import pygame
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
+from tet19_kernels import synth_tone, legato_harmonics, freq_segments
+
+
+def _sleep_until(deadline: float):
+    """Sleep until the given time.monotonic() deadline; return at once if it has passed."""
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+def _make_stereo(wave: np.ndarray, dtype=np.int16) -> np.ndarray:
+    """Cast a mono wave (already in the sample range) into both channels of a C-contiguous (samples, 2) buffer."""
+    stereo = np.empty((wave.size, 2), dtype=dtype)
+    np.copyto(stereo[:, 0], wave, casting='unsafe')
+    stereo[:, 1] = stereo[:, 0]
+    return stereo
 
 
 class NoteEvent:
@@ -23,10 +40,35 @@ class NoteEvent:
         self.legato = legato          # If True, use legato envelope
 
 
+@dataclass
+class Melody:
+    """A list of NoteEvents stored as parallel arrays, one entry per note"""
+    tet_degree: np.ndarray  # 19 TET degrees
+    duration: np.ndarray    # Durations in seconds
+    start_time: np.ndarray  # Start times in seconds
+    velocity: np.ndarray    # Volumes (0.0 to 1.0)
+    legato: np.ndarray      # Legato envelope flags
+    
+    @classmethod
+    def from_events(cls, events: List[NoteEvent]) -> "Melody":
+        """Convert a list of NoteEvent objects into parallel arrays"""
+        return cls(
+            tet_degree=np.array([event.tet_degree for event in events], dtype=np.int32),
+            duration=np.array([event.duration for event in events], dtype=np.float64),
+            start_time=np.array([event.start_time for event in events], dtype=np.float64),
+            velocity=np.array([event.velocity for event in events], dtype=np.float64),
+            legato=np.array([event.legato for event in events], dtype=bool),
+        )
+    
+    def __len__(self) -> int:
+        return len(self.tet_degree)
+
+
 class LegatoSequence:
     """Represents a sequence of notes played with true phase continuity"""
-    def __init__(self, notes_and_durations: List[Tuple[int, float]], start_time: float = 0.0, 
-                 volume: float = 1.0, glide_time: float = 0.02):
+    def __init__(self, notes_and_durations: Optional[List[Tuple[int, float]]] = None, start_time: float = 0.0, 
+                 volume: float = 1.0, glide_time: float = 0.02,
+                 notes: Optional[np.ndarray] = None, durations: Optional[np.ndarray] = None):
         """
         Create a legato sequence with smooth pitch transitions.
         
@@ -35,29 +77,100 @@ class LegatoSequence:
             start_time: When to start the sequence
             velocity: Volume (0.0 to 1.0)
             glide_time: Time to smoothly transition between pitches (seconds)
+            notes, durations: Parallel arrays of tet degrees and durations,
+                              used instead of notes_and_durations
+        
+        Raises:
+            ValueError: If neither or both input forms are given, or the arrays differ in length
         """
-        self.notes_and_durations = notes_and_durations
+        if notes_and_durations is not None:
+            if notes is not None or durations is not None:
+                raise ValueError("Pass either notes_and_durations or notes and durations, not both")
+            notes = [tet_degree for tet_degree, _ in notes_and_durations]
+            durations = [duration for _, duration in notes_and_durations]
+        elif notes is None or durations is None:
+            raise ValueError("notes and durations must be passed together")
+        # Contiguous arrays, as the compiled kernels are built for C layout only
+        self.notes = np.ascontiguousarray(notes, dtype=np.int32)
+        self.durations = np.ascontiguousarray(durations, dtype=np.float64)
+        if self.notes.shape != self.durations.shape or self.notes.ndim != 1:
+            raise ValueError("notes and durations must be 1-D arrays of the same length")
         self.start_time = start_time
         self.velocity = volume
         self.glide_time = glide_time
         
         # Calculate total duration
-        self.duration = sum(duration for _, duration in notes_and_durations)
+        self.duration = sum(self.durations.tolist())
         
         # Cache for pre-computed waveform
         self._cached_waveform = None
         self._cache_params = None
     
+    @property
+    def notes_and_durations(self) -> List[Tuple[int, float]]:
+        """The sequence as (tet_degree, duration) tuples"""
+        return list(zip(self.notes.tolist(), self.durations.tolist()))
+    
     def get_cache_key(self):
         """Generate a cache key based on sequence parameters"""
         return (
-            tuple(self.notes_and_durations),
+            self.notes.tobytes(),
+            self.durations.tobytes(),
             self.velocity,
             self.glide_time,
             self.duration
         )
 
 
+class _LRUCache:
+    """Least recently used cache bounded by the total size of its values, safe to share between threads"""
+    def __init__(self, max_size: int, size_of):
+        """
+        Args:
+            max_size: Largest total size of the cached values
+            size_of: Function returning the size of one value, in the same unit as max_size
+        """
+        self.max_size = max_size
+        self._size_of = size_of
+        self._entries = {}  # Oldest first
+        self._size = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key, create):
+        """Return the value for key, calling create() on a miss and evicting the least recently used values to fit it."""
+        with self._lock:
+            value = self._entries.pop(key, None)
+            if value is not None:
+                # Reinsert as the most recently used entry
+                self._entries[key] = value
+                return value
+        
+        # Create outside the lock, so misses on different threads run in parallel
+        value = create()
+        size = self._size_of(value)
+        if size > self.max_size:
+            return value
+        
+        with self._lock:
+            previous = self._entries.pop(key, None)  # Another thread may have created it meanwhile
+            if previous is not None:
+                self._size -= self._size_of(previous)
+            while self._entries and self._size + size > self.max_size:
+                self._size -= self._size_of(self._entries.pop(next(iter(self._entries))))
+            self._entries[key] = value
+            self._size += size
+        return value
+    
+    def clear(self):
+        """Drop every cached value."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class TET19System:
     """19-tone equal temperament system for generating frequencies and playing music"""
     
@@ -76,9 +189,46 @@ class TET19System:
         self.base_degree = base_degree
         self.cents_per_step = 1200.0 / 19.0  # ~63.16 cents
         
-        # Initialize pygame mixer for audio
-        pygame.mixer.pre_init(frequency=sample_rate, size=-16, channels=2, buffer=512)
-        pygame.mixer.init()
+        # Frequencies of degrees 0-18; every other degree is one of these shifted by whole octaves
+        self._equave_freqs = base_freq * 2.0 ** ((np.arange(19) - base_degree) * self.cents_per_step / 1200.0)
+        
+        # Frequencies of the degrees used in practice (two equaves below to three above)
+        self._freq_lut = {
+            degree: base_freq * 2.0 ** ((degree - base_degree) * self.cents_per_step / 1200.0)
+            for degree in range(-38, 57)
+        }
+        
+        # Amplitudes of the fundamental and harmonics 2-16 (1/i³ decay); legato uses the first 8
+        self._harmonic_amplitudes = 1.0 / np.arange(1, 17) ** 3.0
+        
+        # ADSR attack/decay/release curves keyed by (attack, decay, release samples, sustain),
+        # holding at most 10 s worth of curve samples
+        self._env_curve_cache = _LRUCache(10 * sample_rate, lambda curves: sum(len(curve) for curve in curves))
+        
+        # Recently played note waveforms keyed by (tet_degree, duration, velocity, legato),
+        # holding at most 30 s of audio
+        self._tone_cache = _LRUCache(30 * sample_rate, len)
+        
+        # pygame Sounds for the same keys and with the same bound, so repeated notes skip
+        # the copy into SDL as well
+        self._sound_cache = _LRUCache(30 * sample_rate, lambda sound: int(sound.get_length() * sample_rate))
+        
+        # Initialize pygame mixer for audio, preferring float32 samples so waveforms
+        # synthesized in float32 can be played without an int16 quantization pass
+        try:
+            pygame.mixer.pre_init(frequency=sample_rate, size=32, channels=2, buffer=512)
+            pygame.mixer.init()
+        except pygame.error:
+            pygame.mixer.pre_init(frequency=sample_rate, size=-16, channels=2, buffer=512)
+            pygame.mixer.init()
+        
+        # Sample format of the running mixer (it may already have been initialized elsewhere)
+        if abs(pygame.mixer.get_init()[1]) == 32:
+            self.sample_dtype = np.float32
+            self._full_scale = 1.0
+        else:
+            self.sample_dtype = np.int16
+            self._full_scale = 32767.0
         
         # Store active sounds for polyphony
         self.active_sounds = {}
@@ -94,6 +244,10 @@ class TET19System:
         Returns:
             Frequency in Hz
         """
+        frequency = self._freq_lut.get(tet_degree)
+        if frequency is not None:
+            return frequency
+        
         # Calculate cents from base degree
         cents_offset = (tet_degree - self.base_degree) * self.cents_per_step
         
@@ -102,6 +256,22 @@ class TET19System:
         
         return self.base_freq * frequency_ratio
     
+    def tet_to_frequencies(self, tet_degrees) -> np.ndarray:
+        """
+        Convert many 19 TET degrees to frequencies in Hz at once.
+        
+        Each degree is looked up within a single equave and moved to its octave
+        with ldexp, so no power is evaluated per note.
+        
+        Args:
+            tet_degrees: Sequence or array of 19 TET degrees
+            
+        Returns:
+            Array of frequencies in Hz
+        """
+        octaves, steps = np.divmod(np.asarray(tet_degrees, dtype=np.int32), 19)
+        return np.ldexp(self._equave_freqs[steps], octaves)
+    
     def generate_tone(self, frequency: float, duration: float, velocity: float = 1.0, 
                      attack: float = 0.05, decay: float = 0.15, sustain: float = 0.8, 
                      release: float = 0.3, legato: bool = False) -> np.ndarray:
@@ -127,16 +297,12 @@ class TET19System:
             decay = 0.02                       # Very short decay to sustain quickly
             sustain = 0.95                     # Very high sustain level for smooth connection
         
-        # Generate time array
-        t = np.linspace(0, duration, int(self.sample_rate * duration), False)
-        
-        # Generate basic waveform with 1/i² harmonic series for softer timbre
-        wave = np.sin(2 * np.pi * frequency * t)  # Fundamental
+        num_samples = int(self.sample_rate * duration)
         
-        # Add harmonics with 1/i² amplitude decay for very soft, flute-like timbre
-        for harmonic in range(2, 17):  # Add harmonics 2-16
-            amplitude = 1.0 / (harmonic ** 3)  # 1/i³ decay
-            wave += amplitude * np.sin(2 * np.pi * frequency * harmonic * t)
+        # Fundamental plus harmonics 2-16 with 1/i³ amplitude decay for a very soft,
+        # flute-like timbre, accumulated per sample in a single compiled pass
+        wave = np.empty(num_samples, dtype=np.float32)
+        synth_tone(frequency, self.sample_rate, num_samples, self._harmonic_amplitudes, wave)
         
         # Normalize to prevent clipping due to harmonic addition
         # The sum of 1/i² series converges, but we normalize for safety
@@ -144,14 +310,17 @@ class TET19System:
         wave *= normalization_factor
         
         # Apply ADSR envelope
-        envelope = self._generate_adsr_envelope(len(t), attack, decay, sustain, release, duration)
+        envelope = self._generate_adsr_envelope(num_samples, attack, decay, sustain, release, duration)
         wave *= envelope * velocity
         
-        # Convert to 16-bit integers for pygame
-        wave = np.clip(wave * 32767, -32768, 32767).astype(np.int16)
+        # A float32 mixer takes the wave as is; otherwise scale to the 16-bit range
+        # in place and let the stereo copy do the int16 cast
+        if self.sample_dtype is np.int16:
+            np.multiply(wave, 32767.0, out=wave)
+            np.clip(wave, -32768.0, 32767.0, out=wave)
         
         # Make stereo
-        stereo_wave = np.column_stack((wave, wave))
+        stereo_wave = _make_stereo(wave, self.sample_dtype)
         
         return stereo_wave
     
@@ -174,21 +343,24 @@ class TET19System:
         # Create time array for the entire sequence
         total_samples = int(self.sample_rate * sequence.duration)
         
-        # Pre-compute frequency envelope efficiently
-        frequencies = self._create_frequency_envelope(sequence, total_samples)
-        
-        # Generate phase array with vectorized cumulative sum
-        dt = 1.0 / self.sample_rate
-        phase_increments = 2 * np.pi * frequencies * dt
-        phases = np.cumsum(phase_increments)
-        
-        # Generate fundamental wave efficiently
-        wave = np.sin(phases)
-        
-        # Add harmonics vectorized (only compute a few for efficiency)
-        for harmonic in range(2, 9):  # Reduced from 17 to 9 harmonics for speed
-            amplitude = 1.0 / (harmonic ** 3)
-            wave += amplitude * np.sin(phases * harmonic)
+        # The frequency envelope is piecewise linear, so integrate it in closed form per
+        # segment: after k samples of f = f0 + slope*j the phase has advanced by
+        # 2π·dt·(k·f0 + slope·k(k-1)/2), the same as a running sum of 2π·f·dt.
+        # The running phase stays float64; the stored phases are wrapped to [0, 2π) so
+        # float32 keeps them accurate
+        phases = np.empty(total_samples, dtype=np.float32)
+        phase = 0.0
+        two_pi_dt = 2 * np.pi / self.sample_rate
+        for start, end, start_freq, slope in self._create_frequency_segments(sequence, total_samples):
+            k = np.arange(1, end - start + 1, dtype=np.float64)
+            segment_phases = phase + two_pi_dt * k * (start_freq + 0.5 * slope * (k - 1))
+            phase = segment_phases[-1]
+            phases[start:end] = np.remainder(segment_phases, 2 * np.pi)
+        
+        # Fundamental plus harmonics 2-8 (reduced from 16 for speed), fused into one
+        # compiled pass that reads each phase once
+        wave = np.empty_like(phases)
+        legato_harmonics(phases, self._harmonic_amplitudes[:8], wave)
         
         # Normalize
         normalization_factor = 0.2 / 1.202  # Adjusted for fewer harmonics
@@ -206,11 +378,14 @@ class TET19System:
         
         wave *= envelope * sequence.velocity
         
-        # Convert to 16-bit integers for pygame
-        wave = np.clip(wave * 32767, -32768, 32767).astype(np.int16)
+        # A float32 mixer takes the wave as is; otherwise scale to the 16-bit range
+        # in place and let the stereo copy do the int16 cast
+        if self.sample_dtype is np.int16:
+            np.multiply(wave, 32767.0, out=wave)
+            np.clip(wave, -32768.0, 32767.0, out=wave)
         
         # Make stereo
-        stereo_wave = np.column_stack((wave, wave))
+        stereo_wave = _make_stereo(wave, self.sample_dtype)
         
         # Cache the result
         sequence._cached_waveform = stereo_wave
@@ -218,51 +393,24 @@ class TET19System:
         
         return stereo_wave
     
-    def _create_frequency_envelope(self, sequence: LegatoSequence, total_samples: int) -> np.ndarray:
+    def _create_frequency_segments(self, sequence: LegatoSequence, total_samples: int) -> List[Tuple[int, int, float, float]]:
         """
-        Efficiently create the frequency envelope for a legato sequence.
+        Describe the frequency envelope of a legato sequence as linear segments.
         
         Args:
             sequence: LegatoSequence object
             total_samples: Total number of audio samples
             
         Returns:
-            Array of frequencies for each sample
+            List of (start_sample, end_sample, start_freq, slope) tuples covering all
+            samples in order, where slope is the frequency change per sample
         """
-        frequencies = np.zeros(total_samples)
-        current_time = 0.0
+        # Convert all pitches in one pass
+        target_freqs = self.tet_to_frequencies(sequence.notes)
+        glide_samples = int(sequence.glide_time * self.sample_rate)
         
-        for i, (tet_degree, duration) in enumerate(sequence.notes_and_durations):
-            target_freq = self.tet_to_frequency(tet_degree)
-            
-            # Calculate sample indices for this note
-            start_sample = int(current_time * self.sample_rate)
-            end_sample = int((current_time + duration) * self.sample_rate)
-            end_sample = min(end_sample, total_samples)
-            
-            if i == 0:
-                # First note: start at target frequency
-                frequencies[start_sample:end_sample] = target_freq
-            else:
-                # Subsequent notes: smooth transition from previous frequency
-                glide_samples = int(sequence.glide_time * self.sample_rate)
-                glide_samples = min(glide_samples, end_sample - start_sample)
-                
-                if glide_samples > 0:
-                    # Smooth transition over glide_time using vectorized linspace
-                    prev_freq = frequencies[start_sample - 1] if start_sample > 0 else target_freq
-                    frequencies[start_sample:start_sample + glide_samples] = np.linspace(
-                        prev_freq, target_freq, glide_samples
-                    )
-                    
-                    # Constant frequency for remainder
-                    frequencies[start_sample + glide_samples:end_sample] = target_freq
-                else:
-                    frequencies[start_sample:end_sample] = target_freq
-            
-            current_time += duration
-        
-        return frequencies
+        segments = freq_segments(target_freqs, sequence.durations, self.sample_rate, glide_samples, total_samples)
+        return list(zip(*(column.tolist() for column in segments)))
     
     def precompute_legato_sequence(self, sequence: LegatoSequence):
         """
@@ -274,11 +422,39 @@ class TET19System:
         # This will generate and cache the waveform
         self.generate_legato_sequence(sequence)
     
+    def mix_legato_sequences(self, sequences: List[LegatoSequence]) -> np.ndarray:
+        """
+        Pre-mix several legato sequences into one stereo buffer.
+        
+        Each sequence is placed at its start_time and already carries its own
+        volume, so the voices are simply summed and clipped once.
+        
+        Args:
+            sequences: LegatoSequence objects to mix
+            
+        Returns:
+            Stereo array in the mixer's sample format, starting at time zero
+        """
+        waves = [self.generate_legato_sequence(sequence) for sequence in sequences]
+        offsets = [int(sequence.start_time * self.sample_rate) for sequence in sequences]
+        return self._mix_waves(waves, offsets)
+    
+    def _mix_waves(self, waves: List[np.ndarray], offsets: List[int]) -> np.ndarray:
+        """Sum stereo waves, each starting at its sample offset, into one clipped stereo buffer in the mixer's sample format."""
+        total_samples = max((offset + len(wave) for offset, wave in zip(offsets, waves)), default=0)
+        
+        # One contiguous row per voice, mixed with a single reduction
+        voices = np.zeros((len(waves), total_samples), dtype=np.float32)
+        for row, offset, wave in zip(voices, offsets, waves):
+            row[offset:offset + len(wave)] = wave[:, 0]
+        mix = voices.sum(axis=0)
+        np.clip(mix, -self._full_scale, self._full_scale, out=mix)
+        
+        return _make_stereo(mix, self.sample_dtype)
+    
     def _generate_adsr_envelope(self, length: int, attack: float, decay: float, 
                                sustain: float, release: float, total_duration: float) -> np.ndarray:
         """Generate ADSR envelope for a given length with smooth curves."""
-        envelope = np.zeros(length)
-        
         # Convert time to samples
         attack_samples = int(attack * self.sample_rate)
         decay_samples = int(decay * self.sample_rate)
@@ -291,37 +467,81 @@ class TET19System:
         
         sustain_samples = length - attack_samples - decay_samples - release_samples
         
+        # The curves only depend on their lengths and the sustain level, so compute them once
+        attack_curve, decay_curve, release_curve = self._env_curve_cache.get(
+            (attack_samples, decay_samples, release_samples, sustain),
+            lambda: self._generate_adsr_curves(attack_samples, decay_samples, release_samples, sustain)
+        )
+        
+        envelope = np.empty(length, dtype=np.float32)
         idx = 0
         
-        # Attack - use a smooth exponential curve for very gentle attack
-        if attack_samples > 0:
-            attack_curve = np.linspace(0, 1, attack_samples)
-            # Apply exponential smoothing for softer attack
-            attack_curve = 1 - np.exp(-4 * attack_curve)  # Exponential rise
-            envelope[idx:idx + attack_samples] = attack_curve
-            idx += attack_samples
-        
-        # Decay - use smooth curve
-        if decay_samples > 0:
-            decay_curve = np.linspace(1, sustain, decay_samples)
-            # Apply slight exponential decay for smoothness
-            decay_curve = sustain + (1 - sustain) * np.exp(-3 * np.linspace(0, 1, decay_samples))
-            envelope[idx:idx + decay_samples] = decay_curve
-            idx += decay_samples
+        # Attack
+        envelope[idx:idx + attack_samples] = attack_curve
+        idx += attack_samples
+        
+        # Decay
+        envelope[idx:idx + decay_samples] = decay_curve
+        idx += decay_samples
         
         # Sustain
-        if sustain_samples > 0:
-            envelope[idx:idx + sustain_samples] = sustain
-            idx += sustain_samples
+        envelope[idx:idx + sustain_samples].fill(sustain)
+        idx += sustain_samples
         
-        # Release - smooth exponential decay
-        if release_samples > 0:
-            release_curve = np.linspace(0, 1, release_samples)
-            # Exponential decay for smooth release
-            envelope[idx:idx + release_samples] = sustain * np.exp(-4 * release_curve)
+        # Release
+        envelope[idx:idx + release_samples] = release_curve
         
         return envelope
     
+    def _get_tone(self, tet_degree: int, duration: float, velocity: float = 1.0, legato: bool = False,
+                  frequency: Optional[float] = None) -> np.ndarray:
+        """
+        Return the stereo waveform of a note, synthesizing it only if it is not cached.
+        
+        Duration and velocity are rounded (to 1 ms and 0.01) so repeated notes share one waveform.
+        frequency may pass in the already converted pitch of tet_degree. The returned array is read-only.
+        """
+        key = self._tone_key(tet_degree, duration, velocity, legato)
+        
+        def synthesize():
+            pitch = self.tet_to_frequency(tet_degree) if frequency is None else frequency
+            wave = self.generate_tone(pitch, key[1], key[2], legato=legato)
+            wave.flags.writeable = False
+            return wave
+        
+        return self._tone_cache.get(key, synthesize)
+    
+    def _get_sound(self, tet_degree: int, duration: float, velocity: float = 1.0, legato: bool = False) -> pygame.mixer.Sound:
+        """Return a pygame Sound for a note, creating (and copying into SDL) only on first use."""
+        return self._sound_cache.get(
+            self._tone_key(tet_degree, duration, velocity, legato),
+            lambda: pygame.sndarray.make_sound(self._get_tone(tet_degree, duration, velocity, legato))
+        )
+    
+    @staticmethod
+    def _tone_key(tet_degree: int, duration: float, velocity: float, legato: bool) -> tuple:
+        """Cache key shared by the waveform and Sound caches"""
+        return (tet_degree, round(duration, 3), round(velocity, 2), legato)
+    
+    def _generate_adsr_curves(self, attack_samples: int, decay_samples: int, release_samples: int,
+                              sustain: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Compute the attack, decay and release curves of an ADSR envelope."""
+        # Each curve is an exponential over its own length, evaluated straight from the sample index
+        attack_ramp = np.arange(attack_samples, dtype=np.float32)
+        decay_ramp = np.arange(decay_samples, dtype=np.float32)
+        release_ramp = np.arange(release_samples, dtype=np.float32)
+        
+        # Attack - smooth exponential rise for very gentle attack
+        attack_curve = 1.0 - np.exp((-4.0 / max(attack_samples, 1)) * attack_ramp)
+        
+        # Decay - slight exponential decay to the sustain level for smoothness
+        decay_curve = sustain + (1.0 - sustain) * np.exp((-3.0 / max(decay_samples, 1)) * decay_ramp)
+        
+        # Release - smooth exponential decay
+        release_curve = sustain * np.exp((-4.0 / max(release_samples, 1)) * release_ramp)
+        
+        return attack_curve, decay_curve, release_curve
+    
     def play_note(self, tet_degree: int, duration: float, velocity: float = 1.0, 
                   blocking: bool = False, legato: bool = False) -> int:
         """
@@ -337,26 +557,41 @@ class TET19System:
         Returns:
             Sound ID for tracking
         """
-        frequency = self.tet_to_frequency(tet_degree)
-        wave = self.generate_tone(frequency, duration, velocity, legato=legato)
+        sound = self._get_sound(tet_degree, duration, velocity, legato)
+        return self._play_sound(sound, duration, blocking)
+    
+    def play_buffer(self, wave: np.ndarray, blocking: bool = False) -> int:
+        """
+        Play a pre-rendered stereo buffer, e.g. from mix_legato_sequences.
         
-        # Create pygame sound
+        Args:
+            wave: Stereo array of shape (samples, 2) in the mixer's sample format
+            blocking: If True, wait for the buffer to finish
+            
+        Returns:
+            Sound ID for tracking
+        """
         sound = pygame.sndarray.make_sound(wave)
+        return self._play_sound(sound, len(wave) / self.sample_rate, blocking)
+    
+    def _play_sound(self, sound: pygame.mixer.Sound, duration: float, blocking: bool) -> int:
+        """Start a pygame sound and track it in active_sounds until it has finished."""
         sound_id = self.sound_id_counter
         self.sound_id_counter += 1
         
         # Store and play
         self.active_sounds[sound_id] = sound
         sound.play()
+        end_time = time.monotonic() + duration
         
         if blocking:
-            time.sleep(duration)
+            _sleep_until(end_time)
             if sound_id in self.active_sounds:
                 del self.active_sounds[sound_id]
         else:
             # Clean up after duration
             def cleanup():
-                time.sleep(duration + 0.1)  # Small buffer
+                _sleep_until(end_time + 0.1)  # Small buffer
                 if sound_id in self.active_sounds:
                     del self.active_sounds[sound_id]
             threading.Thread(target=cleanup, daemon=True).start()
@@ -383,14 +618,53 @@ class TET19System:
             sound_ids.append(sound_id)
         
         if blocking:
-            time.sleep(duration)
+            _sleep_until(time.monotonic() + duration)
         
         return sound_ids
     
+    def render_melody(self, notes: List[NoteEvent]) -> np.ndarray:
+        """
+        Synthesize a melodic line offline into a single stereo buffer.
+        
+        Args:
+            notes: List of NoteEvent objects
+            
+        Returns:
+            Stereo array in the mixer's sample format, starting at time zero
+        """
+        melody = Melody.from_events(notes)
+        if len(melody) == 0:
+            return np.zeros((0, 2), dtype=self.sample_dtype)
+        
+        total_samples = int(np.max(melody.start_time + melody.duration) * self.sample_rate)
+        mix = np.zeros((total_samples, 2), dtype=np.float32)
+        
+        # Pitches and sample offsets of all notes in one pass each
+        frequencies = self.tet_to_frequencies(melody.tet_degree)
+        starts = (melody.start_time * self.sample_rate).astype(np.int64)
+        
+        # Sum every note into the master buffer at its start offset
+        for tet_degree, frequency, duration, velocity, legato, start in zip(
+            melody.tet_degree.tolist(),
+            frequencies.tolist(),
+            melody.duration.tolist(),
+            melody.velocity.tolist(),
+            melody.legato.tolist(),
+            starts.tolist(),
+        ):
+            wave = self._get_tone(tet_degree, duration, velocity, legato, frequency)
+            end = min(start + len(wave), total_samples)
+            mix[start:end] += wave[:end - start]
+        
+        np.clip(mix, -self._full_scale, self._full_scale, out=mix)
+        return mix.astype(self.sample_dtype, copy=False)
+    
     def play_melody(self, notes: List[NoteEvent], blocking: bool = False) -> List[int]:
         """
         Play a melodic line with specific timing.
         
+        The whole line is rendered into one buffer first, so it plays as a single sound.
+        
         Args:
             notes: List of NoteEvent objects
             blocking: If True, wait for the entire melody to finish
@@ -398,25 +672,11 @@ class TET19System:
         Returns:
             List of sound IDs
         """
-        sound_ids = []
+        if not notes:
+            return []
         
-        def play_scheduled_notes():
-            start_time = time.time()
-            for note in sorted(notes, key=lambda n: n.start_time):
-                # Wait until it's time to play this note
-                wait_time = note.start_time - (time.time() - start_time)
-                if wait_time > 0:
-                    time.sleep(wait_time)
-                
-                sound_id = self.play_note(note.tet_degree, note.duration, note.velocity, blocking=False, legato=note.legato)
-                sound_ids.append(sound_id)
-        
-        if blocking:
-            play_scheduled_notes()
-        else:
-            threading.Thread(target=play_scheduled_notes, daemon=True).start()
-        
-        return sound_ids
+        wave = self.render_melody(notes)
+        return [self.play_buffer(wave, blocking=blocking)]
     
     def play_legato_sequence(self, sequence: LegatoSequence, blocking: bool = False) -> int:
         """
@@ -429,6 +689,10 @@ class TET19System:
         Returns:
             Sound ID for tracking
         """
+        # Absolute deadlines, so rendering time does not push the schedule back
+        start_deadline = time.monotonic() + sequence.start_time
+        end_deadline = start_deadline + sequence.duration
+        
         # Generate the continuous waveform
         wave = self.generate_legato_sequence(sequence)
         
@@ -439,7 +703,7 @@ class TET19System:
         
         # Schedule playback
         def play_at_time():
-            time.sleep(sequence.start_time)
+            _sleep_until(start_deadline)
             self.active_sounds[sound_id] = sound
             sound.play()
         
@@ -450,58 +714,65 @@ class TET19System:
             sound.play()
         
         if blocking:
-            time.sleep(sequence.start_time + sequence.duration)
+            _sleep_until(end_deadline)
             if sound_id in self.active_sounds:
                 del self.active_sounds[sound_id]
         else:
             # Clean up after duration
             def cleanup():
-                time.sleep(sequence.start_time + sequence.duration + 0.1)
+                _sleep_until(end_deadline + 0.1)
                 if sound_id in self.active_sounds:
                     del self.active_sounds[sound_id]
             threading.Thread(target=cleanup, daemon=True).start()
         
         return sound_id
     
+    def render_voice(self, voice: Union[List[NoteEvent], LegatoSequence]) -> np.ndarray:
+        """
+        Render one voice offline into a stereo buffer.
+        
+        Args:
+            voice: List of NoteEvent objects or a LegatoSequence
+            
+        Returns:
+            Stereo array in the mixer's sample format, starting at time zero
+        """
+        if isinstance(voice, LegatoSequence):
+            wave = self.generate_legato_sequence(voice)
+            offset = int(voice.start_time * self.sample_rate)
+            if offset == 0:
+                return wave
+            
+            # Lead in with silence until the sequence's start time
+            padded = np.zeros((offset + len(wave), 2), dtype=wave.dtype)
+            padded[offset:] = wave
+            return padded
+        
+        return self.render_melody(voice)
+    
     def play_polyphonic(self, voices: List[Union[List[NoteEvent], LegatoSequence]], blocking: bool = False) -> List[List[int]]:
         """
         Play multiple melodic voices simultaneously.
         
+        All voices are rendered offline (concurrently) and mixed into a single sound.
+        
         Args:
             voices: List of voice parts, each containing NoteEvent objects or LegatoSequence
             blocking: If True, wait for all voices to finish
             
         Returns:
-            List of sound ID lists (one per voice)
+            List of sound ID lists (one per voice, all referring to the shared mixed sound)
         """
-        all_sound_ids = []
+        # The synthesis kernels release the GIL, so the voices render in parallel
+        with ThreadPoolExecutor() as executor:
+            waves = list(executor.map(self.render_voice, voices))
         
-        # Start all voices
-        for voice in voices:
-            if isinstance(voice, LegatoSequence):
-                # Handle LegatoSequence
-                sound_ids = self.play_legato_sequence(voice, blocking=False)
-                all_sound_ids.append([sound_ids])  # Wrap in list for consistency
-            else:
-                # Handle list of NoteEvents
-                sound_ids = self.play_melody(voice, blocking=False)
-                all_sound_ids.append(sound_ids)
-        
-        if blocking:
-            # Calculate total duration
-            total_duration = 0
-            for voice in voices:
-                if isinstance(voice, LegatoSequence):
-                    end_time = voice.start_time + voice.duration
-                    total_duration = max(total_duration, end_time)
-                else:
-                    for note in voice:
-                        end_time = note.start_time + note.duration
-                        total_duration = max(total_duration, end_time)
-            
-            time.sleep(total_duration + 0.1)  # Small buffer
+        mix = self._mix_waves(waves, [0] * len(waves))
+        if len(mix) == 0:
+            return [[] for _ in voices]
         
-        return all_sound_ids
+        sound_id = self.play_buffer(mix, blocking=blocking)
+        return [[sound_id] for _ in voices]
     
     def stop_all(self):
         """Stop all currently playing sounds."""
@@ -531,6 +802,7 @@ class TET19System:
     def close(self):
         """Clean up resources."""
         self.stop_all()
+        self._sound_cache.clear()  # Sounds are invalid once the mixer is shut down
         pygame.mixer.quit()
 
 